@@ -6,21 +6,52 @@ A modular, extensible, and powerful command-line framework to automate your digi
 
 import os
 import sys
+import re
 import json
 import click
 import psutil
 import subprocess
 import shutil
+import stat
 import hashlib
+import filecmp
+import heapq
 import secrets
 import string
+import threading
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import zipfile
 import tarfile
-from collections import defaultdict
+from collections import defaultdict, deque
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 import mimetypes
+import mmap
+import sqlite3
+import importlib.util
+
+def _lazy(name):
+    """Register a module that is only executed on first attribute access. Returns None if it isn't installed."""
+    if name in sys.modules:
+        return sys.modules[name]
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        spec = None
+    if spec is None:
+        return None
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
 
 # Third-party imports
 try:
@@ -30,10 +61,14 @@ except ImportError:
     PIL_AVAILABLE = False
 
 try:
-    import PyPDF2
-    PYPDF2_AVAILABLE = True
+    from pypdf import PdfWriter
+    PYPDF_AVAILABLE = True
 except ImportError:
-    PYPDF2_AVAILABLE = False
+    try:
+        from PyPDF2 import PdfWriter
+        PYPDF_AVAILABLE = True
+    except ImportError:
+        PYPDF_AVAILABLE = False
 
 try:
     import qrcode
@@ -42,10 +77,14 @@ except ImportError:
     QRCODE_AVAILABLE = False
 
 try:
-    import boto3
-    BOTO3_AVAILABLE = True
+    import segno
+    SEGNO_AVAILABLE = True
 except ImportError:
-    BOTO3_AVAILABLE = False
+    SEGNO_AVAILABLE = False
+
+# boto3, whois and newsapi are slow to import, so they're loaded on first use
+boto3 = _lazy('boto3')
+BOTO3_AVAILABLE = boto3 is not None
 
 try:
     from moviepy.editor import VideoFileClip
@@ -53,11 +92,8 @@ try:
 except ImportError:
     MOVIEPY_AVAILABLE = False
 
-try:
-    import whois
-    WHOIS_AVAILABLE = True
-except ImportError:
-    WHOIS_AVAILABLE = False
+whois_lib = _lazy('whois')
+WHOIS_AVAILABLE = whois_lib is not None
 
 try:
     from alpha_vantage.timeseries import TimeSeries
@@ -65,15 +101,80 @@ try:
 except ImportError:
     ALPHA_VANTAGE_AVAILABLE = False
 
+newsapi_lib = _lazy('newsapi')
+NEWSAPI_AVAILABLE = newsapi_lib is not None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
-    from newsapi import NewsApiClient
-    NEWSAPI_AVAILABLE = True
+    import pathspec
+    PATHSPEC_AVAILABLE = True
 except ImportError:
-    NEWSAPI_AVAILABLE = False
+    PATHSPEC_AVAILABLE = False
+
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# httpx only helps when its HTTP/2 extra (h2) is installed too
+httpx = _lazy('httpx')
+HTTP2_AVAILABLE = httpx is not None and importlib.util.find_spec('h2') is not None
+
+# Default worker counts for I/O-bound and CPU-bound file commands
+DEFAULT_IO_JOBS = min(32, (os.cpu_count() or 1) * 4)
+DEFAULT_CPU_JOBS = os.cpu_count() or 1
+
+# Directories that file walks skip unless --no-prune is given
+PRUNE_DIRS = frozenset({
+    '.git', 'node_modules', '.venv', 'venv', '__pycache__', '.tox', 'dist', 'build',
+    '.mypy_cache', '.pytest_cache', '.idea', '.vscode'
+})
+
+# Shared HTTP session so repeated API calls reuse pooled keep-alive connections
+HTTP_SESSION = requests.Session()
+_http_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+)
+HTTP_SESSION.mount('http://', _http_adapter)
+HTTP_SESSION.mount('https://', _http_adapter)
+HTTP_TIMEOUT = (3.05, 10)
+
+@lru_cache(maxsize=None)
+def _http2_client():
+    """Return the shared HTTP/2 client, created on first use."""
+    transport = httpx.HTTPTransport(http2=True, retries=3, limits=httpx.Limits(max_keepalive_connections=10))
+    return httpx.Client(transport=transport, timeout=httpx.Timeout(HTTP_TIMEOUT[1], connect=HTTP_TIMEOUT[0]))
+
+def _http_get(url, **kwargs):
+    """GET a URL over HTTP/2 when httpx is available, otherwise through HTTP_SESSION.
+    
+    Errors are raised as requests exceptions either way.
+    """
+    if not HTTP2_AVAILABLE:
+        return HTTP_SESSION.get(url, timeout=HTTP_TIMEOUT, **kwargs)
+    try:
+        return _http2_client().get(url, **kwargs)
+    except httpx.HTTPError as e:
+        raise requests.exceptions.RequestException(str(e)) from e
 
 # Global configuration path
 CONFIG_DIR = Path.home() / ".mycli"
 CONFIG_FILE = CONFIG_DIR / "config.json"
+CACHE_DIR = CONFIG_DIR / "cache"
 
 # Default configuration template
 DEFAULT_CONFIG = {
@@ -109,38 +210,120 @@ DEFAULT_CONFIG = {
     }
 }
 
+def _json_loads(data):
+    """Parse JSON from bytes or str, using orjson when it is installed."""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def _json_dumps(obj):
+    """Serialize obj as JSON indented by two spaces, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2)
+
 def ensure_config():
     """Ensure configuration directory and file exist."""
     CONFIG_DIR.mkdir(exist_ok=True)
     if not CONFIG_FILE.exists():
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(DEFAULT_CONFIG, f, indent=2)
+        CONFIG_FILE.write_text(_json_dumps(DEFAULT_CONFIG), encoding='utf-8')
         click.echo(f"Created default config at {CONFIG_FILE}")
         click.echo("Run 'mycli config edit' to customize your settings.")
 
+@lru_cache(maxsize=1)
+def _read_config(mtime_ns):
+    """Parse the config file; cached per mtime so an edit invalidates it."""
+    return _json_loads(CONFIG_FILE.read_bytes())
+
 def load_config():
     """Load configuration from file."""
     ensure_config()
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
+        return _read_config(CONFIG_FILE.stat().st_mtime_ns)
     except json.JSONDecodeError:
         click.echo("Error: Config file is corrupted. Recreating...")
         CONFIG_FILE.unlink()
         ensure_config()
         return DEFAULT_CONFIG
 
-def check_api_key(config, key_path, service_name):
+# How to fetch each credential from the config, and its name in error messages
+_KEY_GETTERS = {
+    'weather': (lambda c: c['api_keys']['weather_api_key'], 'Weather'),
+    'news': (lambda c: c['api_keys']['news_api_key'], 'News API'),
+    'alpha_vantage': (lambda c: c['api_keys']['alpha_vantage_api_key'], 'Alpha Vantage'),
+    'aws_access_key': (lambda c: c['aws_credentials']['aws_access_key_id'], 'AWS Access Key'),
+    'aws_secret_key': (lambda c: c['aws_credentials']['aws_secret_access_key'], 'AWS Secret Key'),
+    's3_bucket': (lambda c: c['aws_credentials']['default_s3_bucket'], 'Default S3 Bucket'),
+}
+_PLACEHOLDER_PREFIX = "YOUR_"
+
+def check_api_key(config, service):
     """Check if API key is configured and not a placeholder."""
-    keys = config
-    for part in key_path.split('.'):
-        keys = keys.get(part, {})
+    getter, service_name = _KEY_GETTERS[service]
+    try:
+        key = getter(config)
+    except (KeyError, TypeError):
+        key = None
     
-    if not keys or keys.startswith("YOUR_") or keys == "":
+    if not key or key.startswith(_PLACEHOLDER_PREFIX):
         click.echo(f"Error: {service_name} API key not set. Please add it to your config file by running 'mycli config edit'.")
         return False
     return True
 
+def _load_gitignore(root):
+    """Return a PathSpec for root/.gitignore, or None if there is none or pathspec is missing."""
+    gitignore = Path(root) / '.gitignore'
+    if not PATHSPEC_AVAILABLE or not gitignore.is_file():
+        return None
+    with open(gitignore, 'r', encoding='utf-8', errors='ignore') as f:
+        return pathspec.PathSpec.from_lines('gitwildmatch', f)
+
+def _walk_files(root, prune=False, ignore=None):
+    """Yield a DirEntry for every regular file under root, without following symlinks.
+    
+    With prune, directories in PRUNE_DIRS are not descended into. If ignore is a
+    PathSpec, files and directories matching it (relative to root) are skipped too.
+    """
+    prefix_len = len(os.path.join(root, ''))
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if prune and entry.name in PRUNE_DIRS:
+                            continue
+                        if ignore is not None and ignore.match_file(entry.path[prefix_len:].replace(os.sep, '/') + '/'):
+                            continue
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        if ignore is not None and ignore.match_file(entry.path[prefix_len:].replace(os.sep, '/')):
+                            continue
+                        yield entry
+        except OSError:
+            continue
+
+def _entry_stat(entry, fast_stat=False):
+    """Stat a DirEntry once, optionally via statx() without forcing a sync with the server."""
+    if fast_stat and hasattr(os, 'statx'):
+        # AT_STATX_DONT_SYNC lets network filesystems answer from cached attributes
+        return os.statx(entry.path, os.STATX_SIZE | os.STATX_MTIME,
+                        flags=os.AT_STATX_DONT_SYNC, follow_symlinks=False)
+    return entry.stat(follow_symlinks=False)
+
+def _parallel_map(func, items, jobs):
+    """Run func over items on a thread pool, yielding (item, result) pairs in input order."""
+    jobs = max(1, jobs)
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        # Bound the number of queued futures so huge trees don't pile up in memory
+        pending = deque()
+        for item in items:
+            pending.append((item, executor.submit(func, item)))
+            if len(pending) >= jobs * 2:
+                item, future = pending.popleft()
+                yield item, future.result()
+        while pending:
+            item, future = pending.popleft()
+            yield item, future.result()
+
 # Main CLI group
 @click.group()
 def cli():
@@ -156,7 +339,7 @@ def config(action):
     
     if action == 'show':
         config_data = load_config()
-        click.echo(json.dumps(config_data, indent=2))
+        click.echo(_json_dumps(config_data))
     elif action == 'edit':
         editor = os.environ.get('EDITOR', 'nano')
         subprocess.run([editor, str(CONFIG_FILE)])
@@ -190,6 +373,32 @@ def file():
     """File and directory management commands."""
     pass
 
+def _extension_matcher(organize_map):
+    """Return a function mapping a file name to its organize_map category, or None.
+    
+    Multi-part extensions such as '.tar.gz' are checked first, longest first.
+    """
+    simple = {}
+    compound = []
+    for extension, category in organize_map.items():
+        extension = extension.lower()
+        if extension.count('.') > 1:
+            compound.append((extension, category))
+        else:
+            simple[extension] = category
+    compound.sort(key=lambda item: len(item[0]), reverse=True)
+    
+    def match(name):
+        lower = name.lower()
+        for extension, category in compound:
+            if lower.endswith(extension) and len(lower) > len(extension):
+                return category
+        # Like Path.suffix, a name's leading dot doesn't start an extension
+        i = lower.rfind('.')
+        return simple.get(lower[i:]) if i > 0 else None
+    
+    return match
+
 @file.command()
 @click.argument('path', required=False)
 @click.option('--dry-run', is_flag=True, help='Show what would be done without making changes')
@@ -214,21 +423,31 @@ def organize(path, dry_run):
     if dry_run:
         click.echo("DRY RUN - No files will be moved")
     
+    # Work out every move first so each category directory is created only once
+    category_for = _extension_matcher(organize_map)
+    with os.scandir(path_obj) as it:
+        moves = [(entry.name, entry.path, category)
+                 for entry in it
+                 if entry.is_file() and (category := category_for(entry.name)) is not None]
+    
+    target_dirs = {category: os.path.join(path_obj, category) for _, _, category in moves}
+    if not dry_run:
+        for target_dir in target_dirs.values():
+            os.makedirs(target_dir, exist_ok=True)
+    
     moved_count = 0
-    for file_path in path_obj.iterdir():
-        if file_path.is_file():
-            extension = file_path.suffix.lower()
-            if extension in organize_map:
-                target_dir = path_obj / organize_map[extension]
-                target_path = target_dir / file_path.name
-                
-                if dry_run:
-                    click.echo(f"Would move: {file_path.name} -> {organize_map[extension]}/")
-                else:
-                    target_dir.mkdir(exist_ok=True)
-                    file_path.rename(target_path)
-                    click.echo(f"Moved: {file_path.name} -> {organize_map[extension]}/")
-                moved_count += 1
+    for name, source, category in moves:
+        if dry_run:
+            click.echo(f"Would move: {name} -> {category}/")
+        else:
+            target = target_dirs[category] + os.sep + name
+            try:
+                os.rename(source, target)
+            except OSError:
+                # e.g. the category directory is a mount point on another filesystem
+                shutil.move(source, target)
+            click.echo(f"Moved: {name} -> {category}/")
+        moved_count += 1
     
     click.echo(f"{'Would move' if dry_run else 'Moved'} {moved_count} files")
 
@@ -236,7 +455,9 @@ def organize(path, dry_run):
 @click.option('--days', required=True, type=int, help='Delete files older than N days')
 @click.option('--path', default='.', help='Path to clean (default: current directory)')
 @click.option('--dry-run', is_flag=True, help='Show what would be deleted without deleting')
-def cleanup(days, path, dry_run):
+@click.option('--no-prune', is_flag=True, help='Also search VCS, dependency and build directories')
+@click.option('--fast-stat', is_flag=True, help='Use statx() with AT_STATX_DONT_SYNC; sizes and times may be stale on network filesystems (Linux, Python 3.15+)')
+def cleanup(days, path, dry_run, no_prune, fast_stat):
     """Delete files older than specified days."""
     path_obj = Path(path)
     cutoff_date = datetime.now() - timedelta(days=days)
@@ -244,52 +465,75 @@ def cleanup(days, path, dry_run):
     deleted_count = 0
     total_size = 0
     
-    for file_path in path_obj.rglob('*'):
-        if file_path.is_file():
-            file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-            if file_mtime < cutoff_date:
-                file_size = file_path.stat().st_size
-                if dry_run:
-                    click.echo(f"Would delete: {file_path} ({file_size} bytes)")
-                else:
-                    file_path.unlink()
-                    click.echo(f"Deleted: {file_path}")
-                deleted_count += 1
-                total_size += file_size
+    for entry in _walk_files(str(path_obj), prune=not no_prune):
+        st = _entry_stat(entry, fast_stat)
+        file_mtime = datetime.fromtimestamp(st.st_mtime)
+        if file_mtime < cutoff_date:
+            file_size = st.st_size
+            file_path = Path(entry.path)
+            if dry_run:
+                click.echo(f"Would delete: {file_path} ({file_size} bytes)")
+            else:
+                file_path.unlink()
+                click.echo(f"Deleted: {file_path}")
+            deleted_count += 1
+            total_size += file_size
     
     action = "Would delete" if dry_run else "Deleted"
     click.echo(f"{action} {deleted_count} files ({total_size // 1024} KB total)")
 
+def _hash_file(file_path):
+    """Return the BLAKE2b hex digest of a file, read in 1 MiB chunks."""
+    hash_obj = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb', buffering=0) as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            hash_obj.update(chunk)
+    return hash_obj.hexdigest()
+
 @file.command()
 @click.argument('path')
 @click.option('--dry-run', is_flag=True, help='Show duplicates without removing them')
-def deduplicate(path, dry_run):
+@click.option('--jobs', default=DEFAULT_IO_JOBS, type=int, help='Number of files to hash in parallel')
+@click.option('--no-prune', is_flag=True, help='Also search VCS, dependency and build directories')
+def deduplicate(path, dry_run, jobs, no_prune):
     """Remove duplicate files based on content hash."""
     path_obj = Path(path)
-    file_hashes = defaultdict(list)
     
-    # Calculate hashes for all files
-    for file_path in path_obj.rglob('*'):
-        if file_path.is_file():
-            with open(file_path, 'rb') as f:
-                file_hash = hashlib.md5(f.read()).hexdigest()
-                file_hashes[file_hash].append(file_path)
+    # Only files of the same size can be duplicates, so group by size first
+    files_by_size = defaultdict(list)
+    for entry in _walk_files(str(path_obj), prune=not no_prune):
+        files_by_size[entry.stat().st_size].append(entry.path)
+    
+    duplicate_groups = []
+    
+    # Two files of the same size: a direct byte comparison is cheaper than hashing both
+    pairs = [(size, files) for size, files in files_by_size.items() if len(files) == 2]
+    compare = lambda item: filecmp.cmp(item[1][0], item[1][1], shallow=False)
+    for (size, files), same in _parallel_map(compare, pairs, jobs):
+        if same:
+            duplicate_groups.append((size, files))
+    
+    # Larger groups: hash every member
+    size_of = {file_path: size for size, files in files_by_size.items() if len(files) > 2 for file_path in files}
+    file_hashes = defaultdict(list)
+    for file_path, file_hash in _parallel_map(_hash_file, size_of, jobs):
+        file_hashes[(size_of[file_path], file_hash)].append(file_path)
+    duplicate_groups.extend((size, files) for (size, _), files in file_hashes.items() if len(files) > 1)
     
     # Find and handle duplicates
     duplicates_found = 0
-    for file_hash, files in file_hashes.items():
-        if len(files) > 1:
-            click.echo(f"Duplicate files (hash: {file_hash[:8]}...):")
-            for i, file_path in enumerate(files):
-                if i == 0:
-                    click.echo(f"  KEEP: {file_path}")
+    for size, files in duplicate_groups:
+        click.echo(f"Duplicate files ({size} bytes):")
+        for i, file_path in enumerate(map(Path, files)):
+            if i == 0:
+                click.echo(f"  KEEP: {file_path}")
+            else:
+                if dry_run:
+                    click.echo(f"  WOULD DELETE: {file_path}")
                 else:
-                    if dry_run:
-                        click.echo(f"  WOULD DELETE: {file_path}")
-                    else:
-                        file_path.unlink()
-                        click.echo(f"  DELETED: {file_path}")
-                    duplicates_found += 1
+                    file_path.unlink()
+                    click.echo(f"  DELETED: {file_path}")
+                duplicates_found += 1
     
     action = "Would remove" if dry_run else "Removed"
     click.echo(f"{action} {duplicates_found} duplicate files")
@@ -297,27 +541,34 @@ def deduplicate(path, dry_run):
 @file.command()
 @click.argument('path')
 @click.option('--top', default=10, help='Number of largest files to show')
-def bigfiles(path, top):
+@click.option('--no-prune', is_flag=True, help='Also search VCS, dependency and build directories')
+@click.option('--fast-stat', is_flag=True, help='Use statx() with AT_STATX_DONT_SYNC; sizes and times may be stale on network filesystems (Linux, Python 3.15+)')
+def bigfiles(path, top, no_prune, fast_stat):
     """Find the largest files in a directory."""
     path_obj = Path(path)
-    files_with_size = []
-    
-    for file_path in path_obj.rglob('*'):
-        if file_path.is_file():
-            size = file_path.stat().st_size
-            files_with_size.append((size, file_path))
     
-    files_with_size.sort(reverse=True)
+    # Only the top N (size, path) pairs are ever held in memory
+    files_with_size = ((_entry_stat(entry, fast_stat).st_size, entry.path)
+                       for entry in _walk_files(str(path_obj), prune=not no_prune))
+    top_files = heapq.nlargest(top, files_with_size)
     
     click.echo(f"Top {top} largest files in {path}:")
-    for i, (size, file_path) in enumerate(files_with_size[:top]):
+    for i, (size, file_path) in enumerate(top_files):
         size_mb = size / (1024 * 1024)
-        click.echo(f"{i+1:2}. {size_mb:8.1f} MB - {file_path}")
+        click.echo(f"{i+1:2}. {size_mb:8.1f} MB - {Path(file_path)}")
+
+# Already-compressed formats that DEFLATE can't shrink; zip stores them as-is
+INCOMPRESSIBLE_EXTENSIONS = frozenset({
+    '.mp4', '.mov', '.mkv', '.webm', '.mp3', '.m4a', '.ogg', '.flac',
+    '.jpg', '.jpeg', '.png', '.webp', '.gif',
+    '.zip', '.gz', '.tgz', '.xz', '.bz2', '.7z', '.rar', '.iso', '.dmg'
+})
 
 @file.command()
 @click.argument('folder_path')
 @click.option('--format', 'archive_format', default='zip', type=click.Choice(['zip', 'tar']), help='Archive format')
-def archive(folder_path, archive_format):
+@click.option('--level', default=6, type=click.IntRange(1, 9), help='Compression level (1 = fastest, 9 = smallest)')
+def archive(folder_path, archive_format, level):
     """Compress a folder into an archive."""
     folder_path_obj = Path(folder_path)
     if not folder_path_obj.exists() or not folder_path_obj.is_dir():
@@ -326,37 +577,85 @@ def archive(folder_path, archive_format):
     
     if archive_format == 'zip':
         archive_name = f"{folder_path_obj.name}.zip"
-        with zipfile.ZipFile(archive_name, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        with zipfile.ZipFile(archive_name, 'w', zipfile.ZIP_DEFLATED, compresslevel=level) as zipf:
             for file_path in folder_path_obj.rglob('*'):
                 if file_path.is_file():
                     arcname = file_path.relative_to(folder_path_obj.parent)
-                    zipf.write(file_path, arcname)
+                    if file_path.suffix.lower() in INCOMPRESSIBLE_EXTENSIONS:
+                        zipf.write(file_path, arcname, compress_type=zipfile.ZIP_STORED)
+                    else:
+                        zipf.write(file_path, arcname)
     else:  # tar
         archive_name = f"{folder_path_obj.name}.tar.gz"
-        with tarfile.open(archive_name, 'w:gz') as tarf:
-            tarf.add(folder_path_obj, arcname=folder_path_obj.name)
+        pigz = shutil.which('pigz')
+        if pigz:
+            # Stream the tar through pigz so gzip compression uses every core
+            with open(archive_name, 'wb') as out:
+                proc = subprocess.Popen([pigz, f'-{level}', '-p', str(DEFAULT_CPU_JOBS)], stdin=subprocess.PIPE, stdout=out)
+                try:
+                    with tarfile.open(fileobj=proc.stdin, mode='w|') as tarf:
+                        tarf.add(folder_path_obj, arcname=folder_path_obj.name)
+                finally:
+                    proc.stdin.close()
+                    proc.wait()
+            if proc.returncode != 0:
+                click.echo(f"Error: pigz exited with status {proc.returncode}.")
+                return
+        else:
+            with tarfile.open(archive_name, 'w:gz', compresslevel=level) as tarf:
+                tarf.add(folder_path_obj, arcname=folder_path_obj.name)
     
     click.echo(f"Created archive: {archive_name}")
 
+def _extract_zip(f):
+    """Extract a zip archive from an open file into the current directory."""
+    with zipfile.ZipFile(f, 'r') as zipf:
+        zipf.extractall('.')
+
+def _extract_tar(f, compression):
+    """Extract a tar archive from an open file into the current directory."""
+    pigz = shutil.which('pigz') if compression == 'gz' else None
+    if not pigz:
+        with tarfile.open(fileobj=f, mode=f'r:{compression}') as tarf:
+            tarf.extractall('.')
+        return
+    
+    # Let pigz gunzip on other cores while tarfile reads the stream
+    proc = subprocess.Popen([pigz, '-dc'], stdin=f, stdout=subprocess.PIPE, bufsize=1 << 20)
+    try:
+        with tarfile.open(fileobj=proc.stdout, mode='r|') as tarf:
+            tarf.extractall('.')
+    finally:
+        proc.stdout.close()
+        proc.wait()
+    if proc.returncode != 0:
+        raise tarfile.ReadError(f"pigz exited with status {proc.returncode}")
+
+ARCHIVE_EXTRACTORS = {
+    '.zip': _extract_zip,
+    '.tar.gz': partial(_extract_tar, compression='gz'),
+    '.tgz': partial(_extract_tar, compression='gz'),
+    '.tar.bz2': partial(_extract_tar, compression='bz2'),
+    '.tar.xz': partial(_extract_tar, compression='xz'),
+}
+
 @file.command()
 @click.argument('archive_path')
 def extract(archive_path):
-    """Extract a .zip or .tar.gz archive."""
-    archive_path_obj = Path(archive_path)
-    if not archive_path_obj.exists():
-        click.echo("Error: Archive file does not exist.")
+    """Extract a .zip, .tar.gz, .tar.bz2 or .tar.xz archive."""
+    extractor = next((handler for suffix, handler in ARCHIVE_EXTRACTORS.items() if archive_path.endswith(suffix)), None)
+    if extractor is None:
+        click.echo("Error: Unsupported archive format. Use .zip, .tar.gz, .tar.bz2 or .tar.xz files.")
         return
     
-    if archive_path.endswith('.zip'):
-        with zipfile.ZipFile(archive_path, 'r') as zipf:
-            zipf.extractall('.')
-            click.echo(f"Extracted {archive_path}")
-    elif archive_path.endswith('.tar.gz') or archive_path.endswith('.tgz'):
-        with tarfile.open(archive_path, 'r:gz') as tarf:
-            tarf.extractall('.')
-            click.echo(f"Extracted {archive_path}")
-    else:
-        click.echo("Error: Unsupported archive format. Use .zip or .tar.gz files.")
+    try:
+        with open(archive_path, 'rb', buffering=1 << 20) as f:
+            extractor(f)
+        click.echo(f"Extracted {archive_path}")
+    except FileNotFoundError:
+        click.echo("Error: Archive file does not exist.")
+    except (zipfile.BadZipFile, tarfile.TarError) as e:
+        click.echo(f"Error extracting {archive_path}: {e}")
 
 # Developer Toolkit Group
 @cli.group()
@@ -405,22 +704,23 @@ def init(name, project_type):
             "author": "",
             "license": "ISC"
         }
-        (project_path / "package.json").write_text(json.dumps(package_json, indent=2))
+        (project_path / "package.json").write_text(_json_dumps(package_json))
         (project_path / "index.js").write_text('console.log("Hello, World!");\n')
         (project_path / ".gitignore").write_text('node_modules/\nnpm-debug.log*\nyarn-debug.log*\nyarn-error.log*\n.env\n')
         click.echo(f"Created Node.js project: {name}")
 
 @dev.command()
 @click.option('--port', default=8000, help='Port to serve on')
-def serve(port):
+@click.option('--directory', default=None, type=click.Path(exists=True, file_okay=False), help='Directory to serve (default: current directory)')
+def serve(port, directory):
     """Start a local HTTP server."""
-    import http.server
-    import socketserver
+    from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
     
-    handler = http.server.SimpleHTTPRequestHandler
+    # One thread per request so a slow client can't stall the others
+    handler = partial(SimpleHTTPRequestHandler, directory=directory)
     
     try:
-        with socketserver.TCPServer(("", port), handler) as httpd:
+        with ThreadingHTTPServer(("", port), handler) as httpd:
             click.echo(f"Serving at http://localhost:{port}")
             click.echo("Press Ctrl+C to stop the server")
             httpd.serve_forever()
@@ -432,9 +732,29 @@ def serve(port):
         else:
             click.echo(f"Error starting server: {e}")
 
+_BLANK_LINE_RE = re.compile(rb'^[ \t\r\f\v]*$', re.MULTILINE)
+_COMMENT_LINE_RE = re.compile(rb'^[ \t\f\v]*(?:#|//|/\*)', re.MULTILINE)
+
+def _count_lines(file_path):
+    """Return (lines, blank, comments) for a source file, or None if it can't be read."""
+    try:
+        with open(file_path, 'rb') as f:
+            data = f.read()
+    except:
+        return None
+    
+    # The regexes see an empty "line" after a trailing newline; don't count it
+    ends_with_newline = not data or data.endswith(b'\n')
+    lines = data.count(b'\n') + (not ends_with_newline)
+    blank = len(_BLANK_LINE_RE.findall(data)) - ends_with_newline
+    comments = len(_COMMENT_LINE_RE.findall(data))
+    return lines, blank, comments
+
 @dev.command()
 @click.argument('path')
-def cloc(path):
+@click.option('--jobs', default=DEFAULT_IO_JOBS, type=int, help='Number of files to read in parallel')
+@click.option('--no-prune', is_flag=True, help='Also count VCS, dependency and build directories and .gitignore matches')
+def cloc(path, jobs, no_prune):
     """Count Lines of Code in a project."""
     path_obj = Path(path)
     if not path_obj.exists():
@@ -462,24 +782,19 @@ def cloc(path):
     
     stats = defaultdict(lambda: {'files': 0, 'lines': 0, 'blank': 0, 'comments': 0})
     
-    for file_path in path_obj.rglob('*'):
-        if file_path.is_file() and file_path.suffix in language_extensions:
-            language = language_extensions[file_path.suffix]
-            stats[language]['files'] += 1
-            
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-                    stats[language]['lines'] += len(lines)
-                    
-                    for line in lines:
-                        stripped = line.strip()
-                        if not stripped:
-                            stats[language]['blank'] += 1
-                        elif stripped.startswith('#') or stripped.startswith('//') or stripped.startswith('/*'):
-                            stats[language]['comments'] += 1
-            except:
-                continue
+    ignore = None if no_prune else _load_gitignore(path_obj)
+    source_files = ((entry.path, language_extensions[extension])
+                    for entry in _walk_files(str(path_obj), prune=not no_prune, ignore=ignore)
+                    if (extension := os.path.splitext(entry.name)[1]) in language_extensions)
+    
+    for (file_path, language), counts in _parallel_map(lambda item: _count_lines(item[0]), source_files, jobs):
+        stats[language]['files'] += 1
+        if counts is None:
+            continue
+        lines, blank, comments = counts
+        stats[language]['lines'] += lines
+        stats[language]['blank'] += blank
+        stats[language]['comments'] += comments
     
     if not stats:
         click.echo("No code files found.")
@@ -501,9 +816,58 @@ def cloc(path):
     click.echo("-" * 50)
     click.echo(f"{'Total':<12} {total_files:<6} {total_lines:<8} {total_blank:<6} {total_comments:<8}")
 
+_TODO_MARKERS = (b'todo:', b'fixme:')
+_TODO_RE = re.compile(b'|'.join(map(re.escape, _TODO_MARKERS)), re.IGNORECASE)
+_hyperscan_local = threading.local()
+
+@lru_cache(maxsize=None)
+def _todo_hyperscan_db():
+    """Compile the Hyperscan database for the TODO markers once per process."""
+    db = hyperscan.Database()
+    db.compile(expressions=list(_TODO_MARKERS), flags=[hyperscan.HS_FLAG_CASELESS] * len(_TODO_MARKERS))
+    return db
+
+def _todo_offsets(data):
+    """Return an offset inside each TODO/FIXME marker in data, in ascending order."""
+    if not HYPERSCAN_AVAILABLE:
+        return [m.start() for m in _TODO_RE.finditer(data)]
+    
+    # Scratch space can't be shared between threads, so keep one per worker
+    db = _todo_hyperscan_db()
+    scratch = getattr(_hyperscan_local, 'scratch', None)
+    if scratch is None:
+        scratch = _hyperscan_local.scratch = hyperscan.Scratch(db)
+    offsets = []
+    db.scan(data, match_event_handler=lambda expr_id, start, end, flags, context: offsets.append(end - 1), scratch=scratch)
+    return offsets
+
+def _scan_todos(file_path):
+    """Return (line_num, line) pairs for each TODO/FIXME comment in a file."""
+    try:
+        with open(file_path, 'rb') as f:
+            data = f.read()
+    except:
+        return []
+    
+    matches = []
+    line_num, counted_to, line_end = 1, 0, -1
+    for offset in _todo_offsets(data):
+        if offset < line_end:
+            continue  # another marker on a line already reported
+        line_start = data.rfind(b'\n', 0, offset) + 1
+        line_end = data.find(b'\n', offset)
+        if line_end == -1:
+            line_end = len(data)
+        line_num += data.count(b'\n', counted_to, line_start)
+        counted_to = line_start
+        matches.append((line_num, data[line_start:line_end].decode('utf-8', errors='ignore').strip()))
+    return matches
+
 @dev.command()
 @click.argument('path')
-def find_todos(path):
+@click.option('--jobs', default=DEFAULT_IO_JOBS, type=int, help='Number of files to scan in parallel')
+@click.option('--no-prune', is_flag=True, help='Also search VCS, dependency and build directories and .gitignore matches')
+def find_todos(path, jobs, no_prune):
     """Find TODO and FIXME comments in code files."""
     path_obj = Path(path)
     if not path_obj.exists():
@@ -513,18 +877,17 @@ def find_todos(path):
     code_extensions = {'.py', '.js', '.ts', '.java', '.c', '.cpp', '.h', '.css', '.html', '.php', '.rb', '.go', '.rs', '.sh'}
     todos_found = 0
     
-    for file_path in path_obj.rglob('*'):
-        if file_path.is_file() and file_path.suffix in code_extensions:
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    for line_num, line in enumerate(f, 1):
-                        line_lower = line.lower()
-                        if 'todo:' in line_lower or 'fixme:' in line_lower:
-                            relative_path = file_path.relative_to(path_obj)
-                            click.echo(f"{relative_path}:{line_num}: {line.strip()}")
-                            todos_found += 1
-            except:
-                continue
+    ignore = None if no_prune else _load_gitignore(path_obj)
+    code_files = (entry.path for entry in _walk_files(str(path_obj), prune=not no_prune, ignore=ignore)
+                  if os.path.splitext(entry.name)[1] in code_extensions)
+    
+    for file_path, matches in _parallel_map(_scan_todos, code_files, jobs):
+        if not matches:
+            continue
+        relative_path = Path(file_path).relative_to(path_obj)
+        for line_num, line in matches:
+            click.echo(f"{relative_path}:{line_num}: {line}")
+            todos_found += 1
     
     if todos_found == 0:
         click.echo("No TODO or FIXME comments found.")
@@ -535,19 +898,18 @@ def find_todos(path):
 def git_summary():
     """Show Git repository summary."""
     try:
-        # Check if we're in a git repository
-        result = subprocess.run(['git', 'rev-parse', '--git-dir'], 
-                              capture_output=True, text=True, check=True)
-        
-        # Get current branch
-        branch_result = subprocess.run(['git', 'branch', '--show-current'], 
-                                     capture_output=True, text=True)
-        current_branch = branch_result.stdout.strip() or "detached HEAD"
-        
-        # Get status
-        status_result = subprocess.run(['git', 'status', '--porcelain'], 
-                                     capture_output=True, text=True)
-        uncommitted_changes = len(status_result.stdout.strip().split('\n')) if status_result.stdout.strip() else 0
+        # One status call gives the branch and the changed files, and fails outside a repository
+        status_result = subprocess.run(['git', 'status', '--porcelain=v2', '--branch'], 
+                                     capture_output=True, text=True, check=True)
+        current_branch = "detached HEAD"
+        uncommitted_changes = 0
+        for line in status_result.stdout.splitlines():
+            if line.startswith('# branch.head '):
+                head = line[len('# branch.head '):]
+                if head != '(detached)':
+                    current_branch = head
+            elif not line.startswith('#'):
+                uncommitted_changes += 1
         
         # Get last 3 commits
         log_result = subprocess.run(['git', 'log', '--oneline', '-3'], 
@@ -574,12 +936,42 @@ def convert():
     """Content conversion commands."""
     pass
 
+# Pillow's encoder name for each --to choice
+PIL_FORMATS = {'png': 'PNG', 'jpg': 'JPEG', 'webp': 'WEBP'}
+
+def _convert_image(file_path, target_format, quality):
+    """Convert a single image and return the output path."""
+    with Image.open(file_path) as img:
+        # Convert RGBA to RGB for formats that don't support transparency
+        if target_format in ['jpg'] and img.mode in ('RGBA', 'LA'):
+            background = Image.new('RGB', img.size, (255, 255, 255))
+            background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
+            img = background
+        
+        output_path = file_path.with_suffix(f'.{target_format}')
+        
+        save_kwargs = {}
+        if target_format in ['jpg', 'webp']:
+            save_kwargs['quality'] = quality
+            save_kwargs['optimize'] = True
+        if target_format == 'jpg':
+            save_kwargs['subsampling'] = '4:2:0'
+        elif target_format == 'webp':
+            save_kwargs['method'] = 4  # balanced encode speed vs. size (0 fastest, 6 smallest)
+        
+        img.save(output_path, format=PIL_FORMATS[target_format], **save_kwargs)
+        return output_path
+
 @convert.command()
 @click.argument('path')
 @click.option('--to', 'target_format', required=True, type=click.Choice(['png', 'jpg', 'webp']), help='Target format')
 @click.option('--quality', default=95, type=int, help='Quality for lossy formats (1-100)')
-def img(path, target_format, quality):
-    """Convert images to different formats."""
+@click.option('--jobs', default=DEFAULT_CPU_JOBS, type=int, help='Number of images to convert in parallel')
+def img(path, target_format, quality, jobs):
+    """Convert images to different formats.
+    
+    Install pillow-simd in place of Pillow for faster decoding and encoding.
+    """
     if not PIL_AVAILABLE:
         click.echo("Error: Pillow library not installed. Run 'pip install Pillow'")
         return
@@ -596,30 +988,21 @@ def img(path, target_format, quality):
     if path_obj.is_file():
         files_to_process = [path_obj]
     else:
-        files_to_process = [f for f in path_obj.rglob('*') if f.is_file() and f.suffix.lower() in image_extensions]
+        files_to_process = [Path(entry.path) for entry in _walk_files(str(path_obj))
+                            if os.path.splitext(entry.name)[1].lower() in image_extensions]
     
-    for file_path in files_to_process:
+    def convert_one(file_path):
         try:
-            with Image.open(file_path) as img:
-                # Convert RGBA to RGB for formats that don't support transparency
-                if target_format in ['jpg'] and img.mode in ('RGBA', 'LA'):
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-                    img = background
-                
-                output_path = file_path.with_suffix(f'.{target_format}')
-                
-                save_kwargs = {}
-                if target_format in ['jpg', 'webp']:
-                    save_kwargs['quality'] = quality
-                    save_kwargs['optimize'] = True
-                
-                img.save(output_path, format=target_format.upper(), **save_kwargs)
-                click.echo(f"Converted: {file_path.name} -> {output_path.name}")
-                converted_count += 1
-                
+            return _convert_image(file_path, target_format, quality), None
         except Exception as e:
-            click.echo(f"Error converting {file_path}: {e}")
+            return None, e
+    
+    for file_path, (output_path, error) in _parallel_map(convert_one, files_to_process, jobs):
+        if error is not None:
+            click.echo(f"Error converting {file_path}: {error}")
+        else:
+            click.echo(f"Converted: {file_path.name} -> {output_path.name}")
+            converted_count += 1
     
     click.echo(f"Converted {converted_count} images to {target_format}")
 
@@ -652,10 +1035,8 @@ def extract_audio(video_file, output):
 @click.option('--output', required=True, help='Output PDF file name')
 def pdf_merge(output):
     """Merge multiple PDF files into one."""
-    try:
-        import PyPDF2
-    except ImportError:
-        click.echo("Error: PyPDF2 library not installed. Run 'pip install PyPDF2'")
+    if not PYPDF_AVAILABLE:
+        click.echo("Error: pypdf library not installed. Run 'pip install pypdf'")
         return
     
     pdf_files = []
@@ -677,16 +1058,19 @@ def pdf_merge(output):
         return
     
     try:
-        merger = PyPDF2.PdfMerger()
-        
-        for pdf_file in pdf_files:
-            merger.append(str(pdf_file))
-            click.echo(f"Added: {pdf_file}")
+        writer = PdfWriter()
         
-        with open(output, 'wb') as output_file:
-            merger.write(output_file)
+        # Inputs are read lazily, so they stay open until the merged file is written
+        with ExitStack() as stack:
+            for pdf_file in pdf_files:
+                f = stack.enter_context(open(pdf_file, 'rb', buffering=1 << 20))
+                writer.append(f, import_outline=False)
+                click.echo(f"Added: {pdf_file}")
+            
+            with open(output, 'wb') as output_file:
+                writer.write(output_file)
         
-        merger.close()
+        writer.close()
         click.echo(f"Merged {len(pdf_files)} PDFs into: {output}")
         
     except Exception as e:
@@ -697,10 +1081,17 @@ def pdf_merge(output):
 @click.option('--output', required=True, help='Output image file name')
 def qr(text, output):
     """Generate QR code from text."""
+    if SEGNO_AVAILABLE:
+        # segno encodes much faster and writes PNG/SVG directly, picked by the output suffix
+        qr = segno.make_qr(text, error='l', boost_error=False)
+        qr.save(output, scale=10, border=4)
+        click.echo(f"QR code generated: {output}")
+        return
+    
     try:
         import qrcode
     except ImportError:
-        click.echo("Error: qrcode library not installed. Run 'pip install qrcode[pil]'")
+        click.echo("Error: qrcode library not installed. Run 'pip install segno' or 'pip install qrcode[pil]'")
         return
     
     qr = qrcode.QRCode(
@@ -722,22 +1113,49 @@ def data():
     """Data dashboard commands for fetching external data."""
     pass
 
+# Seconds a cached API response stays fresh
+CACHE_TTL = {'weather': 600, 'news': 300, 'stock': 60}
+
+def _cached_json(key, ttl, fetch, use_cache=True):
+    """Return fetch()'s JSON-serializable result, reusing an on-disk copy younger than ttl seconds."""
+    path = CACHE_DIR / hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+    if use_cache:
+        try:
+            if time.time() - path.stat().st_mtime < ttl:
+                return _json_loads(path.read_bytes())
+        except (OSError, ValueError):
+            pass
+    
+    data = fetch()
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(_json_dumps(data), encoding='utf-8')
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+    return data
+
 @data.command()
 @click.argument('city')
-def weather(city):
+@click.option('--no-cache', is_flag=True, help='Fetch fresh data instead of using a cached response')
+def weather(city, no_cache):
     """Get current weather for a city."""
     config_data = load_config()
     api_key = config_data['api_keys']['weather_api_key']
     
-    if not check_api_key(config_data, 'api_keys.weather_api_key', 'Weather'):
+    if not check_api_key(config_data, 'weather'):
         return
     
     url = f"http://api.openweathermap.org/data/2.5/weather?q={city}&appid={api_key}&units=metric"
     
-    try:
-        response = requests.get(url)
+    def fetch():
+        response = HTTP_SESSION.get(url, timeout=HTTP_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        return response.json()
+    
+    try:
+        data = _cached_json(url, CACHE_TTL['weather'], fetch, use_cache=not no_cache)
         
         weather_desc = data['weather'][0]['description'].title()
         temp = data['main']['temp']
@@ -756,30 +1174,37 @@ def weather(city):
 
 @data.command()
 @click.argument('tickers', nargs=-1, required=True)
-def stock(tickers):
+@click.option('--no-cache', is_flag=True, help='Fetch fresh quotes instead of using cached ones')
+def stock(tickers, no_cache):
     """Get current stock prices for one or more tickers."""
     config_data = load_config()
     api_key = config_data['api_keys']['alpha_vantage_api_key']
     
-    if not check_api_key(config_data, 'api_keys.alpha_vantage_api_key', 'Alpha Vantage'):
+    if not check_api_key(config_data, 'alpha_vantage'):
         return
     
     try:
         from alpha_vantage.timeseries import TimeSeries
         ts = TimeSeries(key=api_key, output_format='pandas')
         
-        for ticker in tickers:
+        def fetch_quote(ticker):
+            data, meta_data = ts.get_quote_endpoint(symbol=ticker)
+            return [float(data['05. price']), float(data['09. change']), float(data['10. change percent'].rstrip('%'))]
+        
+        def quote_line(ticker):
             try:
-                data, meta_data = ts.get_quote_endpoint(symbol=ticker)
-                price = float(data['05. price'])
-                change = float(data['09. change'])
-                change_percent = float(data['10. change percent'].rstrip('%'))
+                price, change, change_percent = _cached_json(f"stock:{ticker.upper()}", CACHE_TTL['stock'],
+                                                             lambda: fetch_quote(ticker), use_cache=not no_cache)
                 
                 change_sign = "+" if change >= 0 else ""
-                click.echo(f"{ticker.upper()}: ${price:.2f} ({change_sign}{change:.2f}, {change_sign}{change_percent:.2f}%)")
+                return f"{ticker.upper()}: ${price:.2f} ({change_sign}{change:.2f}, {change_sign}{change_percent:.2f}%)"
                 
             except Exception as e:
-                click.echo(f"Error fetching data for {ticker}: {e}")
+                return f"Error fetching data for {ticker}: {e}"
+        
+        # Quotes are independent network calls, so fetch them concurrently
+        for ticker, line in _parallel_map(quote_line, tickers, min(8, len(tickers))):
+            click.echo(line)
                 
     except ImportError:
         click.echo("Error: alpha_vantage library not installed. Run 'pip install alpha_vantage'")
@@ -787,31 +1212,37 @@ def stock(tickers):
 @data.command()
 @click.option('--query', default=None, help='Search query for news')
 @click.option('--country', default='us', type=click.Choice(['us', 'gb', 'ca', 'au']), help='Country for top headlines')
-def news(query, country):
+@click.option('--no-cache', is_flag=True, help='Fetch fresh headlines instead of using cached ones')
+def news(query, country, no_cache):
     """Get top news headlines."""
     config_data = load_config()
     api_key = config_data['api_keys']['news_api_key']
     
-    if not check_api_key(config_data, 'api_keys.news_api_key', 'News API'):
+    if not check_api_key(config_data, 'news'):
         return
     
     try:
-        from newsapi import NewsApiClient
-        newsapi = NewsApiClient(api_key=api_key)
+        if not NEWSAPI_AVAILABLE:
+            raise ImportError
+        newsapi = newsapi_lib.NewsApiClient(api_key=api_key, session=HTTP_SESSION)
         
-        if query:
-            articles = newsapi.get_everything(q=query, language='en', sort_by='relevancy', page_size=5)
-        else:
-            articles = newsapi.get_top_headlines(country=country, page_size=5)
+        def fetch():
+            if query:
+                return newsapi.get_everything(q=query, language='en', sort_by='relevancy', page_size=5)
+            return newsapi.get_top_headlines(country=country, page_size=5)
+        
+        cache_key = f"news:search:{query}" if query else f"news:headlines:{country}"
+        articles = _cached_json(cache_key, CACHE_TTL['news'], fetch, use_cache=not no_cache)
         
         if articles['status'] == 'ok' and articles['articles']:
-            click.echo(f"Top {'search results' if query else 'headlines'}:")
+            lines = [f"Top {'search results' if query else 'headlines'}:"]
             for i, article in enumerate(articles['articles'], 1):
-                click.echo(f"{i}. {article['title']}")
-                click.echo(f"   Source: {article['source']['name']}")
+                lines.append(f"{i}. {article['title']}")
+                lines.append(f"   Source: {article['source']['name']}")
                 if article.get('description'):
-                    click.echo(f"   {article['description'][:100]}...")
-                click.echo()
+                    lines.append(f"   {article['description'][:100]}...")
+                lines.append("")
+            click.echo("\n".join(lines))
         else:
             click.echo("No articles found.")
             
@@ -820,26 +1251,70 @@ def news(query, country):
     except Exception as e:
         click.echo(f"Error fetching news: {e}")
 
+# Shortened URLs are reused for a week, and served stale if the shortener is unreachable
+URL_CACHE_FILE = CACHE_DIR / "urls.sqlite"
+URL_CACHE_TTL = 7 * 24 * 3600
+
+# URL shorteners: API endpoint and fixed query parameters. Each returns the short URL as plain text.
+SHORTENERS = {
+    'tinyurl': ("https://tinyurl.com/api-create.php", {}),
+    'isgd': ("https://is.gd/create.php", {'format': 'simple'}),
+}
+
+def _open_url_cache():
+    """Open the shortened-URL cache, creating it if needed. Returns None if it can't be used."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(URL_CACHE_FILE)
+        conn.execute("CREATE TABLE IF NOT EXISTS short_urls (provider TEXT NOT NULL, url TEXT NOT NULL, "
+                     "short_url TEXT NOT NULL, fetched_at REAL NOT NULL, PRIMARY KEY (provider, url))")
+        return conn
+    except (OSError, sqlite3.Error):
+        return None
+
 @data.command()
 @click.argument('url')
-def shorten_url(url):
+@click.option('--provider', default='tinyurl', type=click.Choice(list(SHORTENERS)), help='URL shortening service')
+def shorten_url(url, provider):
     """Shorten a URL using a public API."""
-    # Using TinyURL as a simple, free API
-    api_url = f"http://tinyurl.com/api-create.php?url={url}"
+    api_url, params = SHORTENERS[provider]
+    
+    cache = _open_url_cache()
+    cached = None
+    if cache is not None:
+        cached = cache.execute("SELECT short_url, fetched_at FROM short_urls WHERE provider = ? AND url = ?",
+                               (provider, url)).fetchone()
+        if cached and time.time() - cached[1] < URL_CACHE_TTL:
+            click.echo(f"Original: {url}")
+            click.echo(f"Shortened: {cached[0]}")
+            cache.close()
+            return
     
     try:
-        response = requests.get(api_url)
+        response = _http_get(api_url, params={**params, 'url': url}, headers={'Accept': 'text/plain'})
         if response.status_code == 200:
             short_url = response.text.strip()
             if short_url.startswith('http'):
                 click.echo(f"Original: {url}")
                 click.echo(f"Shortened: {short_url}")
+                if cache is not None:
+                    with cache:
+                        cache.execute("INSERT OR REPLACE INTO short_urls VALUES (?, ?, ?, ?)",
+                                      (provider, url, short_url, time.time()))
             else:
                 click.echo(f"Error: {short_url}")
         else:
             click.echo("Error: Failed to shorten URL")
     except requests.exceptions.RequestException as e:
-        click.echo(f"Error: {e}")
+        if cached:
+            click.echo(f"Warning: {e}; using cached result.")
+            click.echo(f"Original: {url}")
+            click.echo(f"Shortened: {cached[0]}")
+        else:
+            click.echo(f"Error: {e}")
+    finally:
+        if cache is not None:
+            cache.close()
 
 # Cloud Integration Group
 @cli.group()
@@ -847,27 +1322,86 @@ def cloud():
     """Cloud storage integration commands."""
     pass
 
+def _env_int(name, default):
+    """Read an integer from the environment, falling back to default if unset or invalid."""
+    try:
+        return int(os.environ[name])
+    except (KeyError, ValueError):
+        return default
+
+# S3 transfer tuning, overridable from the environment
+S3_MAX_CONCURRENCY = _env_int('S3_MAX_CONCURRENCY', 10)
+S3_IO_CHUNKSIZE = _env_int('S3_IO_CHUNKSIZE', 1024 * 1024)
+
+S3_MULTIPART_CHUNKSIZE = 16 * 1024 * 1024
+
+@lru_cache(maxsize=None)
+def _transfer_config(chunksize=S3_MULTIPART_CHUNKSIZE):
+    """Return the multipart, multi-threaded TransferConfig used for uploads and downloads."""
+    from boto3.s3.transfer import TransferConfig
+    return TransferConfig(
+        multipart_threshold=8 * 1024 * 1024,
+        multipart_chunksize=chunksize,
+        max_concurrency=S3_MAX_CONCURRENCY,
+        max_io_queue=1000,
+        io_chunksize=S3_IO_CHUNKSIZE,
+        use_threads=True
+    )
+
+def _upload_chunksize(size):
+    """Pick a part size that keeps large uploads to about 1000 parts, in whole MiB."""
+    mib = 1024 * 1024
+    # S3 parts can't be larger than 5 GiB
+    return min(5 * 1024 * mib, max(S3_MULTIPART_CHUNKSIZE, -(-size // 1000 // mib) * mib))
+
+@lru_cache(maxsize=4)
+def _build_s3(access_key, secret_key, region):
+    """Build an S3 client with adaptive retries, reused for the same credentials and region."""
+    import botocore.session
+    from botocore.config import Config
+    config = Config(
+        retries={'max_attempts': 10, 'mode': 'adaptive'},
+        # Enough connections for every transfer thread
+        max_pool_connections=max(20, S3_MAX_CONCURRENCY)
+    )
+    session = boto3.Session(botocore_session=botocore.session.Session())
+    return session.client(
+        's3',
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        region_name=region,
+        config=config
+    )
+
 def get_s3_client(config_data):
     """Get configured S3 client."""
     aws_config = config_data['aws_credentials']
     
-    if (not check_api_key(config_data, 'aws_credentials.aws_access_key_id', 'AWS Access Key') or
-        not check_api_key(config_data, 'aws_credentials.aws_secret_access_key', 'AWS Secret Key') or
-        not check_api_key(config_data, 'aws_credentials.default_s3_bucket', 'Default S3 Bucket')):
+    if (not check_api_key(config_data, 'aws_access_key') or
+        not check_api_key(config_data, 'aws_secret_key') or
+        not check_api_key(config_data, 's3_bucket')):
         return None, None
     
     try:
-        import boto3
-        s3_client = boto3.client(
-            's3',
-            aws_access_key_id=aws_config['aws_access_key_id'],
-            aws_secret_access_key=aws_config['aws_secret_access_key']
+        if not BOTO3_AVAILABLE:
+            raise ImportError
+        s3_client = _build_s3(
+            aws_config['aws_access_key_id'],
+            aws_config['aws_secret_access_key'],
+            aws_config.get('region') or None
         )
         return s3_client, aws_config['default_s3_bucket']
     except ImportError:
         click.echo("Error: boto3 library not installed. Run 'pip install boto3'")
         return None, None
 
+def _parse_s3(path, default_bucket, default_key=''):
+    """Split an s3://bucket/key path (or a bare key) into bucket and key."""
+    if path.startswith('s3://'):
+        bucket, _, key = path[5:].partition('/')
+        return bucket, key or default_key
+    return default_bucket, path or default_key
+
 @cloud.command()
 @click.argument('s3_path', default='')
 def ls(s3_path):
@@ -878,60 +1412,85 @@ def ls(s3_path):
     if not s3_client:
         return
     
-    # Parse s3_path
-    if s3_path.startswith('s3://'):
-        parts = s3_path[5:].split('/', 1)
-        bucket = parts[0]
-        prefix = parts[1] if len(parts) > 1 else ''
-    else:
-        bucket = default_bucket
-        prefix = s3_path
+    bucket, prefix = _parse_s3(s3_path, default_bucket)
     
     try:
-        response = s3_client.list_objects_v2(Bucket=bucket, Prefix=prefix)
+        paginator = s3_client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(Bucket=bucket, Prefix=prefix, PaginationConfig={'PageSize': 1000})
         
-        if 'Contents' in response:
-            click.echo(f"Files in s3://{bucket}/{prefix}:")
-            for obj in response['Contents']:
+        found = False
+        for page in pages:
+            contents = page.get('Contents')
+            if not contents:
+                continue
+            if not found:
+                click.echo(f"Files in s3://{bucket}/{prefix}:")
+                found = True
+            # One write per page rather than per object
+            rows = []
+            for obj in contents:
                 size = obj['Size']
-                modified = obj['LastModified'].strftime('%Y-%m-%d %H:%M:%S')
-                click.echo(f"  {size:>10} {modified} {obj['Key']}")
-        else:
+                # isoformat skips strftime's format parsing; [:19] drops the '+00:00' boto3's UTC times carry
+                modified = obj['LastModified'].isoformat(sep=' ', timespec='seconds')[:19]
+                rows.append(f"  {size:>10} {modified} {obj['Key']}")
+            click.echo("\n".join(rows))
+        
+        if not found:
             click.echo("No files found.")
             
     except Exception as e:
         click.echo(f"Error listing S3 files: {e}")
 
 @cloud.command()
-@click.argument('local_file')
-@click.argument('s3_path', default='')
-def upload(local_file, s3_path):
-    """Upload a file to S3."""
+@click.argument('paths', nargs=-1, required=True, metavar='LOCAL_FILE... [S3_PATH]')
+@click.option('--jobs', default=10, type=int, help='Number of files to upload in parallel')
+def upload(paths, jobs):
+    """Upload one or more files to S3."""
     config_data = load_config()
     s3_client, default_bucket = get_s3_client(config_data)
     
     if not s3_client:
         return
     
-    local_path = Path(local_file)
-    if not local_path.exists():
-        click.echo("Error: Local file does not exist.")
-        return
+    # The last argument is the destination if it's an s3:// path or not a local file
+    local_files, s3_path = list(paths), ''
+    if len(paths) > 1 and (paths[-1].startswith('s3://') or not os.path.isfile(paths[-1])):
+        s3_path = local_files.pop()
     
-    # Parse s3_path
-    if s3_path.startswith('s3://'):
-        parts = s3_path[5:].split('/', 1)
-        bucket = parts[0]
-        key = parts[1] if len(parts) > 1 else local_path.name
-    else:
-        bucket = default_bucket
-        key = s3_path if s3_path else local_path.name
+    bucket, dest = _parse_s3(s3_path, default_bucket)
+    # Several files (or a trailing '/') put each file under dest; a single file otherwise lands at dest
+    as_prefix = len(local_files) > 1 or dest.endswith('/')
     
-    try:
-        s3_client.upload_file(str(local_path), bucket, key)
-        click.echo(f"Uploaded: {local_file} -> s3://{bucket}/{key}")
-    except Exception as e:
-        click.echo(f"Error uploading file: {e}")
+    uploads = []
+    for local_file in local_files:
+        local_path = Path(local_file)
+        try:
+            st = os.stat(local_path)
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
+            click.echo(f"Error: Local file does not exist: {local_file}")
+            continue
+        if as_prefix:
+            prefix = dest.rstrip('/')
+            key = f"{prefix}/{local_path.name}" if prefix else local_path.name
+        else:
+            key = dest or local_path.name
+        uploads.append((local_file, key, st.st_size))
+    
+    def upload_one(item):
+        local_file, key, size = item
+        try:
+            s3_client.upload_file(local_file, bucket, key, Config=_transfer_config(_upload_chunksize(size)))
+        except Exception as e:
+            return e
+    
+    # boto3 clients are thread-safe, so all files share one client and its connection pool
+    for (local_file, key, _), error in _parallel_map(upload_one, uploads, min(jobs, len(uploads))):
+        if error is not None:
+            click.echo(f"Error uploading {local_file}: {error}")
+        else:
+            click.echo(f"Uploaded: {local_file} -> s3://{bucket}/{key}")
 
 @cloud.command()
 @click.argument('s3_path')
@@ -944,23 +1503,41 @@ def download(s3_path, local_path):
     if not s3_client:
         return
     
-    # Parse s3_path
-    if s3_path.startswith('s3://'):
-        parts = s3_path[5:].split('/', 1)
-        bucket = parts[0]
-        key = parts[1]
-    else:
-        bucket = default_bucket
-        key = s3_path
+    bucket, key = _parse_s3(s3_path, default_bucket)
+    if not key:
+        click.echo("Error: No S3 key given.")
+        return
     
     if not local_path:
         local_path = Path(key).name
     
     try:
-        s3_client.download_file(bucket, key, local_path)
+        # Ask for the size first so a missing key fails before the local file is touched
+        size = s3_client.head_object(Bucket=bucket, Key=key)['ContentLength']
+    except Exception as e:
+        click.echo(f"Error downloading file: {e}")
+        return
+    
+    try:
+        fd = os.open(local_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    except OSError as e:
+        click.echo(f"Error downloading file: {e}")
+        return
+    
+    try:
+        with os.fdopen(fd, 'wb', buffering=1 << 20) as f:
+            # Reserve the space up front so the file is laid out in as few extents as possible
+            if size and hasattr(os, 'posix_fallocate'):
+                try:
+                    os.posix_fallocate(fd, 0, size)
+                except OSError:
+                    pass
+            s3_client.download_fileobj(bucket, key, f, Config=_transfer_config())
         click.echo(f"Downloaded: s3://{bucket}/{key} -> {local_path}")
     except Exception as e:
         click.echo(f"Error downloading file: {e}")
+        # Don't leave a truncated file behind
+        Path(local_path).unlink(missing_ok=True)
 
 # Security & Crypto Group
 @cli.group()
@@ -968,30 +1545,74 @@ def crypto():
     """Security and cryptographic commands."""
     pass
 
+# Files up to this size are hashed from a single memory map
+MMAP_HASH_LIMIT = 512 * 1024 * 1024
+
 @crypto.command()
 @click.argument('input_data')
-@click.option('--algo', default='sha256', type=click.Choice(['sha256', 'md5']), help='Hash algorithm')
+@click.option('--algo', default='sha256', type=click.Choice(['sha256', 'md5', 'blake3']), help='Hash algorithm')
 def hash(input_data, algo):
     """Calculate hash of a file or string."""
-    path_obj = Path(input_data)
+    if algo == 'blake3' and not BLAKE3_AVAILABLE:
+        click.echo("Error: blake3 library not installed. Run 'pip install blake3'")
+        return
     
-    if path_obj.exists() and path_obj.is_file():
+    try:
+        st = os.stat(input_data)
+        is_file = stat.S_ISREG(st.st_mode)
+    except (OSError, ValueError):
+        is_file = False
+    
+    if is_file and algo == 'blake3':
+        # blake3 maps the file itself and hashes it on several threads
+        hash_obj = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        hash_obj.update_mmap(input_data)
+        click.echo(f"{algo.upper()} hash of file '{input_data}': {hash_obj.hexdigest()}")
+    elif is_file:
         # Hash a file
-        hash_obj = hashlib.sha256() if algo == 'sha256' else hashlib.md5()
-        
-        with open(path_obj, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_obj.update(chunk)
+        with open(input_data, 'rb') as f:
+            if 0 < st.st_size <= MMAP_HASH_LIMIT:
+                # One update() over the mapping; the kernel pages the file in as it's read
+                hash_obj = hashlib.new(algo)
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    hash_obj.update(mm)
+            elif hasattr(hashlib, 'file_digest'):
+                # Python 3.11+: the read/update loop runs in C
+                hash_obj = hashlib.file_digest(f, algo)
+            else:
+                hash_obj = hashlib.new(algo)
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    hash_obj.update(chunk)
         
         hash_value = hash_obj.hexdigest()
         click.echo(f"{algo.upper()} hash of file '{input_data}': {hash_value}")
     else:
         # Hash a string
-        hash_obj = hashlib.sha256() if algo == 'sha256' else hashlib.md5()
+        hash_obj = blake3.blake3() if algo == 'blake3' else hashlib.new(algo)
         hash_obj.update(input_data.encode('utf-8'))
         hash_value = hash_obj.hexdigest()
         click.echo(f"{algo.upper()} hash of string: {hash_value}")
 
+PASSWORD_SYMBOLS = "!@#$%^&*"
+PASSWORD_CATEGORIES = (string.ascii_uppercase, string.ascii_lowercase, string.digits, PASSWORD_SYMBOLS)
+PASSWORD_CHARS = ''.join(PASSWORD_CATEGORIES)
+# Bytes at or above this are discarded so that b % len(PASSWORD_CHARS) stays unbiased
+_PASSWORD_BYTE_LIMIT = 256 - 256 % len(PASSWORD_CHARS)
+
+def _random_password(length):
+    """Draw a uniformly random password containing every category, using one os.urandom call per attempt."""
+    n = len(PASSWORD_CHARS)
+    while True:
+        chars = []
+        while len(chars) < length:
+            chars.extend(PASSWORD_CHARS[b % n] for b in os.urandom(length * 2) if b < _PASSWORD_BYTE_LIMIT)
+        password = ''.join(chars[:length])
+        # Retry rather than patching in missing categories, which would skew the distribution
+        if all(any(c in category for c in password) for category in PASSWORD_CATEGORIES):
+            return password
+
 @crypto.command()
 @click.option('--length', default=16, help='Password length')
 def passwd(length):
@@ -1000,52 +1621,51 @@ def passwd(length):
         click.echo("Error: Password length must be at least 4 characters.")
         return
     
-    # Ensure we have at least one character from each category
-    uppercase = string.ascii_uppercase
-    lowercase = string.ascii_lowercase
-    digits = string.digits
-    symbols = "!@#$%^&*"
-    
-    password = [
-        secrets.choice(uppercase),
-        secrets.choice(lowercase),
-        secrets.choice(digits),
-        secrets.choice(symbols)
-    ]
-    
-    # Fill the rest randomly
-    all_chars = uppercase + lowercase + digits + symbols
-    for _ in range(length - 4):
-        password.append(secrets.choice(all_chars))
-    
-    # Shuffle the password
-    secrets.SystemRandom().shuffle(password)
-    final_password = ''.join(password)
+    final_password = _random_password(length)
     
     click.echo(f"Generated password: {final_password}")
 
-@crypto.command()
-@click.argument('domain')
-def whois(domain):
-    """Perform WHOIS lookup for a domain."""
+@lru_cache(maxsize=1024)
+def _cached_whois(domain):
+    """Look up a domain, remembering results for the rest of the process."""
+    if not WHOIS_AVAILABLE:
+        raise ImportError
+    return whois_lib.whois(domain)
+
+def _whois_report(domain):
+    """Format the WHOIS record for a domain, or an error message."""
     try:
-        import whois as whois_lib
-        
-        w = whois_lib.whois(domain)
-        
-        click.echo(f"WHOIS information for {domain}:")
-        click.echo(f"Registrar: {w.registrar}")
-        click.echo(f"Creation date: {w.creation_date}")
-        click.echo(f"Expiration date: {w.expiration_date}")
-        click.echo(f"Name servers: {w.name_servers}")
-        
-        if w.emails:
-            click.echo(f"Contact emails: {', '.join(w.emails)}")
-            
+        w = _cached_whois(domain.lower())
     except ImportError:
-        click.echo("Error: python-whois library not installed. Run 'pip install python-whois'")
+        return "Error: python-whois library not installed. Run 'pip install python-whois'"
     except Exception as e:
-        click.echo(f"Error performing WHOIS lookup: {e}")
+        return f"Error performing WHOIS lookup: {e}"
+    
+    lines = [
+        f"WHOIS information for {domain}:",
+        f"Registrar: {w.registrar}",
+        f"Creation date: {w.creation_date}",
+        f"Expiration date: {w.expiration_date}",
+        f"Name servers: {w.name_servers}"
+    ]
+    if w.emails:
+        lines.append(f"Contact emails: {', '.join(w.emails)}")
+    return "\n".join(lines)
+
+@crypto.command()
+@click.argument('domains', nargs=-1, required=True)
+def whois(domains):
+    """Perform WHOIS lookup for one or more domains."""
+    if not WHOIS_AVAILABLE:
+        click.echo("Error: python-whois library not installed. Run 'pip install python-whois'")
+        return
+    
+    # Each lookup is a separate connection to a WHOIS server, so run them concurrently
+    domains = list(dict.fromkeys(domains))
+    for i, (domain, report) in enumerate(_parallel_map(_whois_report, domains, min(8, len(domains)))):
+        if i:
+            click.echo()
+        click.echo(report)
 
 if __name__ == '__main__':
     cli()
\ No newline at end of file